@@ -1,9 +1,11 @@
 # app/agents/parent_agent.py
 
+import asyncio
+import io
 import re
-from typing import Tuple, List, Optional
+from typing import AsyncIterator, Dict, Tuple, List, Optional
 
-import httpx
+import orjson
 
 from app.core.config import settings
 from app.core.logging_config import logger
@@ -12,9 +14,52 @@ from app.models.schemas import (
     WeatherInfo,
     TourismAgentResult,
 )
+from app.services.http_client import get_http_client
 from app.services.nominatim_client import geocode_place
 from app.agents.weather_agent import WeatherAgent
-from app.agents.places_agent import PlacesAgent
+from app.agents.places_agent import (
+    DEFAULT_MAX_PLACES,
+    FAMOUS_CITY_LOCATIONS,
+    FAMOUS_PLACES,
+    PlacesAgent,
+)
+
+# Intent keywords are plain substring matches (e.g. "rain" also matches
+# "rainy"), compiled once into a single alternation per intent.
+_WEATHER_RE = re.compile(
+    "|".join(["weather", "temperature", "hot", "cold", "rain"]),
+    re.IGNORECASE,
+)
+_PLACES_RE = re.compile(
+    "|".join(
+        [
+            "visit",
+            "attractions",
+            "tourist",
+            "sightseeing",
+            "things to do",
+        ]
+    ),
+    re.IGNORECASE,
+)
+
+# Tried in order; the first pattern that matches wins.
+_PLACE_PATTERNS = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"\bgoing to\s+([A-Za-z\s]+?)(?:[.,!?]|$)",
+        r"\bgo to\s+([A-Za-z\s]+?)(?:[.,!?]|$)",
+        r"\bin\s+([A-Za-z\s]+?)(?:[.,!?]|$)",
+    )
+]
+
+
+# Fixed pieces of the template reply
+_RAINING_TEXT = "and it is currently raining."
+_NOT_RAINING_TEXT = "and it is not raining right now."
+_AND_PLACES_HEADER = "And these are the places you can go: - - - - -"
+_PLACES_HEADER_SUFFIX = "these are the places you can go: - - - - -"
+_NO_PLACES_TEXT = "I couldn't find clear tourist attractions nearby."
 
 
 class TourismParentAgent:
@@ -25,6 +70,41 @@ class TourismParentAgent:
       - composes a final natural-language reply (local LLM or template)
     """
 
+    # Output rules for the local LLM (built once, sent as Ollama's "system")
+    _SYSTEM_PROMPT = """
+You are a tourism assistant. You must ALWAYS follow EXACTLY the following output rules:
+
+1. NEVER write more than 2 short lines before the places list.
+2. NEVER write additional sentences before or after the response.
+3. NEVER add emojis.
+4. NEVER summarize. NEVER explain. NEVER talk about weather sources or tools.
+5. ONLY output in this exact format:
+
+### If ONLY weather is requested:
+In <CITY> it's currently <TEMP>°C with a chance of <RAIN>% to rain.
+
+### If ONLY places are requested:
+In <CITY> these are the places you can go:
+- Place 1
+- Place 2
+- Place 3
+
+### If BOTH weather & places are requested:
+In <CITY> it's currently <TEMP>°C with a chance of <RAIN>% to rain.
+And these are the places you can go:
+- Place 1
+- Place 2
+- Place 3
+
+###Important:
+If the place is not found (location is None), reply with:
+"It doesn’t know this place exists."
+Do not write anything else.
+
+
+Absolutely NO other text is allowed.
+"""
+
     def __init__(self) -> None:
         self.weather_agent = WeatherAgent()
         self.places_agent = PlacesAgent()
@@ -33,6 +113,15 @@ class TourismParentAgent:
         self.llm_url = settings.LOCAL_LLM_URL       # e.g. http://localhost:11434/api/generate
         self.llm_model = settings.LOCAL_LLM_MODEL   # e.g. deepseek-r1:1.5b
 
+        # Curated cities have fixed locations, and their places-only replies
+        # are fully determined by FAMOUS_PLACES, so build both once and serve
+        # them without any geocoding or Overpass calls.
+        self._curated_locations = {
+            city_key: PlaceLocation(name=name, latitude=lat, longitude=lon)
+            for city_key, (name, lat, lon) in FAMOUS_CITY_LOCATIONS.items()
+        }
+        self._curated_results = self._build_curated_results()
+
     # ---------------- Handle Message ----------------
 
     async def handle_message(self, message: str) -> TourismAgentResult:
@@ -55,11 +144,24 @@ class TourismParentAgent:
             )
 
         logger.info(
-            f"ParentAgent: intent parsed -> place={place_query!r}, "
-            f"need_weather={need_weather}, need_places={need_places}"
+            "ParentAgent: intent parsed -> place=%r, need_weather=%s, need_places=%s",
+            place_query,
+            need_weather,
+            need_places,
         )
 
-        location = await geocode_place(place_query)
+        city_key = place_query.lower()
+        if need_places and not need_weather:
+            curated = self._curated_results.get(city_key)
+            if curated is not None:
+                logger.info("ParentAgent: serving precomputed reply for %r", place_query)
+                return curated
+
+        # Use the same fixed location for curated cities whatever the intent,
+        # so replies name the city consistently.
+        location = self._curated_locations.get(city_key)
+        if location is None:
+            location = await geocode_place(place_query)
         if location is None:
             return TourismAgentResult(
                 reply=(
@@ -67,16 +169,11 @@ class TourismParentAgent:
                 )
             )
 
-        weather: Optional[WeatherInfo] = None
-        places: List[str] = []
-
-        if need_weather:
-            weather = await self.weather_agent.get_weather_for_location(location)
-
-        if need_places:
-            places = await self.places_agent.get_places_for_location(location)
+        weather, places = await self._fetch_details(
+            location, need_weather=need_weather, need_places=need_places
+        )
 
-        reply_text = await self._compose_reply(
+        reply_text = self._compose_reply(
             original_message=message,
             location=location,
             weather=weather,
@@ -92,28 +189,73 @@ class TourismParentAgent:
             places=places,
         )
 
+    async def _fetch_details(
+        self,
+        location: PlaceLocation,
+        need_weather: bool,
+        need_places: bool,
+    ) -> Tuple[Optional[WeatherInfo], List[str]]:
+        """
+        Run the weather and places agents concurrently. A failure in one
+        agent falls back to None / [] without affecting the other.
+        """
+        weather: Optional[WeatherInfo] = None
+        places: List[str] = []
+
+        tasks = []
+        if need_weather:
+            tasks.append(self.weather_agent.get_weather_for_location(location))
+        if need_places:
+            tasks.append(self.places_agent.get_places_for_location(location))
+
+        # With return_exceptions=True a cancelled child comes back as a
+        # CancelledError, which is a BaseException rather than an Exception.
+        results = list(await asyncio.gather(*tasks, return_exceptions=True))
+
+        if need_weather:
+            result = results.pop(0)
+            if isinstance(result, BaseException):
+                logger.error("ParentAgent: weather agent failed: %r", result)
+            else:
+                weather = result
+
+        if need_places:
+            result = results.pop(0)
+            if isinstance(result, BaseException):
+                logger.error("ParentAgent: places agent failed: %r", result)
+            else:
+                places = result
+
+        return weather, places
+
+    def _build_curated_results(self) -> Dict[str, TourismAgentResult]:
+        results: Dict[str, TourismAgentResult] = {}
+
+        for city_key, location in self._curated_locations.items():
+            places = FAMOUS_PLACES[city_key][:DEFAULT_MAX_PLACES]
+            reply_text = self._compose_reply(
+                original_message="",
+                location=location,
+                weather=None,
+                places=places,
+                need_weather=False,
+                need_places=True,
+            )
+            results[city_key] = TourismAgentResult(
+                reply=reply_text,
+                place=location,
+                places=places,
+            )
+
+        return results
+
     # ---------------- Intent Parsing ----------------
 
     def _parse_intent(
         self, message: str
     ) -> Tuple[Optional[str], bool, bool]:
-        lower = message.lower()
-
-        need_weather = any(
-            w in lower for w in ["weather", "temperature", "hot", "cold", "rain"]
-        )
-        need_places = any(
-            w in lower
-            for w in [
-                "visit",
-                "attractions",
-                "places to visit",
-                "place to visit",
-                "tourist",
-                "sightseeing",
-                "things to do",
-            ]
-        )
+        need_weather = bool(_WEATHER_RE.search(message))
+        need_places = bool(_PLACES_RE.search(message))
 
         if not (need_weather or need_places):
             need_weather = True
@@ -125,14 +267,8 @@ class TourismParentAgent:
     def _extract_place_name(self, message: str) -> Optional[str]:
         text = message.strip()
 
-        patterns = [
-            r"\bgoing to\s+([A-Za-z\s]+?)(?:[.,!?]|$)",
-            r"\bgo to\s+([A-Za-z\s]+?)(?:[.,!?]|$)",
-            r"\bin\s+([A-Za-z\s]+?)(?:[.,!?]|$)",
-        ]
-
-        for p in patterns:
-            m = re.search(p, text, flags=re.IGNORECASE)
+        for p in _PLACE_PATTERNS:
+            m = p.search(text)
             if m:
                 return m.group(1).strip()
 
@@ -147,7 +283,7 @@ class TourismParentAgent:
 
         # ---------------- Reply Composition ----------------
 
-    async def _compose_reply(
+    def _compose_reply(
         self,
         original_message: str,
         location: PlaceLocation,
@@ -169,32 +305,28 @@ class TourismParentAgent:
         if need_weather and weather:
             # We don't have exact rain probability, only boolean.
             # So we keep the sentence simple.
+            parts = [f"In {city} it's currently {weather.temperature_c:.0f}°C"]
             if weather.is_raining is True:
-                rain_part = "and it is currently raining."
+                parts.append(_RAINING_TEXT)
             elif weather.is_raining is False:
-                rain_part = "and it is not raining right now."
-            else:
-                rain_part = ""
+                parts.append(_NOT_RAINING_TEXT)
 
-            lines.append(
-                f"In {city} it's currently {weather.temperature_c:.0f}°C {rain_part}".strip()
-            )
+            lines.append(" ".join(parts))
 
         # 2) Places-only or part of combined reply
         if need_places:
             if need_weather and weather:
                 # Combined weather + places -> use "And these..."
-                lines.append("And these are the places you can go: - - - - -")
+                lines.append(_AND_PLACES_HEADER)
             else:
                 # Only places
-                lines.append(f"In {city} these are the places you can go: - - - - -")
+                lines.append(f"In {city} {_PLACES_HEADER_SUFFIX}")
 
             if places:
                 # One place per line, like the examples
-                for p in places:
-                    lines.append(p)
+                lines.extend(places)
             else:
-                lines.append("I couldn't find clear tourist attractions nearby.")
+                lines.append(_NO_PLACES_TEXT)
 
         # 3) If somehow neither flag is set, fall back to a generic message
         if not lines:
@@ -235,9 +367,6 @@ class TourismParentAgent:
 
         rain_chance = "100" if (weather and weather.is_raining) else "0"
 
-        # Prepare places list
-        place_lines = "\n".join([f"- {p}" for p in places]) if places else ""
-
         # Context for LLM
         context = {
             "original_message": original_message,
@@ -249,65 +378,55 @@ class TourismParentAgent:
             "need_places": need_places,
         }
 
-        system_prompt = """
-You are a tourism assistant. You must ALWAYS follow EXACTLY the following output rules:
-
-1. NEVER write more than 2 short lines before the places list.
-2. NEVER write additional sentences before or after the response.
-3. NEVER add emojis.
-4. NEVER summarize. NEVER explain. NEVER talk about weather sources or tools.
-5. ONLY output in this exact format:
-
-### If ONLY weather is requested:
-In <CITY> it's currently <TEMP>°C with a chance of <RAIN>% to rain.
-
-### If ONLY places are requested:
-In <CITY> these are the places you can go:
-- Place 1
-- Place 2
-- Place 3
-
-### If BOTH weather & places are requested:
-In <CITY> it's currently <TEMP>°C with a chance of <RAIN>% to rain.
-And these are the places you can go:
-- Place 1
-- Place 2
-- Place 3
-
-###Important:
-If the place is not found (location is None), reply with:
-"It doesn’t know this place exists."
-Do not write anything else.
-
-
-Absolutely NO other text is allowed.
-"""
-
-        user_prompt = f"""
-Context JSON:
-{context}
-
-Generate the reply STRICTLY following the formatting rules above.
-"""
+        user_prompt = (
+            "Context JSON:\n"
+            + orjson.dumps(context).decode()
+            + "\n\nGenerate the reply STRICTLY following the formatting rules above.\n"
+        )
 
+        # The static system prompt goes in Ollama's separate "system" field so
+        # the model can reuse its prefix across requests.
         payload = {
             "model": self.llm_model,
-            "prompt": system_prompt + "\n" + user_prompt,
-            "stream": False,
+            "system": self._SYSTEM_PROMPT,
+            "prompt": user_prompt,
+            "stream": True,
         }
 
-        async with httpx.AsyncClient(timeout=40.0) as client:
-            resp = await client.post(self.llm_url, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
-
-        # Ollama /api/generate response format
-        output = (
-            data.get("response")
-            or data.get("message", {}).get("content", "")
-        )
+        buf = io.StringIO()
+        async for chunk in self._stream_local_llm(payload):
+            buf.write(chunk)
 
+        output = buf.getvalue()
         if not output:
             raise RuntimeError("Local LLM returned empty output")
 
         return output.strip()
+
+    async def _stream_local_llm(self, payload: dict) -> AsyncIterator[str]:
+        """
+        POST a streaming request to Ollama and yield text chunks as they
+        arrive (one JSON object per line), so callers can relay the first
+        tokens before generation finishes.
+        """
+        client = get_http_client()
+        async with client.stream(
+            "POST", self.llm_url, json=payload, timeout=40.0
+        ) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line:
+                    continue
+
+                data = orjson.loads(line)
+
+                # Ollama /api/generate (or /api/chat) chunk format
+                chunk = (
+                    data.get("response")
+                    or data.get("message", {}).get("content", "")
+                )
+                if chunk:
+                    yield chunk
+
+                if data.get("done"):
+                    break
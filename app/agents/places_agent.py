@@ -1,13 +1,31 @@
 # app/agents/places_agent.py
 
-from typing import List
+import re
+from typing import Dict, List, Optional
 import httpx
+import orjson
 
 from app.models.schemas import PlaceLocation
+from app.core.cache import MISSING, TTLCache
 from app.core.logging_config import logger
+from app.services.http_client import get_http_client
 
 OVERPASS_URL = "https://overpass-api.de/api/interpreter"
 
+# Curated-match outcome per (location name, max_results), including "no
+# curated match" (None). Only name-determined results go here: Overpass
+# results depend on coordinates and are cached in _OVERPASS_CACHE, since
+# different places can share a name (Cambridge UK / Cambridge MA).
+CURATED_CACHE_TTL_S = 6 * 3600
+
+_CURATED_CACHE = TTLCache(maxsize=512, ttl=CURATED_CACHE_TTL_S)
+
+# Overpass results per (lat, lon rounded to ~110 m, radius, max_results), so
+# different names for the same spot also skip the API. POIs don't move.
+OVERPASS_CACHE_TTL_S = 6 * 3600
+
+_OVERPASS_CACHE = TTLCache(maxsize=1024, ttl=OVERPASS_CACHE_TTL_S)
+
 # --------- Curated Famous Places ---------
 
 FAMOUS_PLACES = {
@@ -21,15 +39,6 @@ FAMOUS_PLACES = {
         "ISKCON Temple",
         "Vidhana Soudha",
     ],
-    "bengaluru": [
-        "Lalbagh Botanical Garden",
-        "Cubbon Park",
-        "Bangalore Palace",
-        "Bannerghatta Biological Park",
-        "Jawaharlal Nehru Planetarium",
-        "ISKCON Temple",
-        "Vidhana Soudha",
-    ],
 
     # Delhi / New Delhi
     "delhi": [
@@ -41,15 +50,6 @@ FAMOUS_PLACES = {
         "Humayun's Tomb",
         "Jama Masjid",
     ],
-    "new delhi": [
-        "Red Fort",
-        "India Gate",
-        "Qutub Minar",
-        "Lotus Temple",
-        "Akshardham Temple",
-        "Humayun's Tomb",
-        "Jama Masjid",
-    ],
 
     # Goa
     "goa": [
@@ -93,6 +93,69 @@ FAMOUS_PLACES = {
     ],
 }
 
+# Alternate names sharing a curated list
+FAMOUS_PLACES["bengaluru"] = FAMOUS_PLACES["bangalore"]
+FAMOUS_PLACES["new delhi"] = FAMOUS_PLACES["delhi"]
+
+# Default number of places returned per location
+DEFAULT_MAX_PLACES = 10
+
+# Display name (as Nominatim names the city) and city-centre coordinates for
+# each curated alias, so requests for these cities skip geocoding.
+FAMOUS_CITY_LOCATIONS = {
+    "bangalore": ("Bengaluru", 12.9716, 77.5946),
+    "bengaluru": ("Bengaluru", 12.9716, 77.5946),
+    "delhi": ("Delhi", 28.6519, 77.2315),
+    "new delhi": ("New Delhi", 28.6139, 77.2090),
+    "goa": ("Goa", 15.2993, 74.1240),
+    "mumbai": ("Mumbai", 19.0760, 72.8777),
+    "hyderabad": ("Hyderabad", 17.3850, 78.4867),
+    "chennai": ("Chennai", 13.0827, 80.2707),
+}
+
+
+def _build_city_matcher(aliases: Dict[str, str]) -> "re.Pattern[str]":
+    # Longest alternatives first so e.g. "new delhi" wins over a shorter key
+    alternation = "|".join(
+        re.escape(alias) for alias in sorted(aliases, key=len, reverse=True)
+    )
+    return re.compile(alternation)
+
+
+# Matched text -> curated city key. Built once at import so a lookup is a
+# single regex scan over the location name instead of looping over every key.
+_CITY_KEYS: Dict[str, str] = {key: key for key in FAMOUS_PLACES}
+_CITY_WORD_KEYS: Dict[str, str] = {}
+for _city_key in FAMOUS_PLACES:
+    for _word in _city_key.split():
+        _CITY_WORD_KEYS.setdefault(_word, _city_key)
+
+_CITY_RE = _build_city_matcher(_CITY_KEYS)
+_CITY_WORD_RE = _build_city_matcher(_CITY_WORD_KEYS)
+
+# Substrings that mark obviously non-tourist POIs (hotels, hostels, etc.),
+# compiled into one case-insensitive alternation.
+_BANNED_NAME_RE = re.compile(
+    "|".join(
+        re.escape(bad)
+        for bad in [
+            "hotel",
+            "hostel",
+            "guest house",
+            "guesthouse",
+            "lodge",
+            "pg",
+            "residency",
+            "residence",
+            "enterprise",
+            "hall",
+            "mahal",
+            "marriage",
+        ]
+    ),
+    re.IGNORECASE,
+)
+
 
 class PlacesAgent:
     """
@@ -109,32 +172,68 @@ class PlacesAgent:
         self,
         location: PlaceLocation,
         radius_m: int = 8000,
-        max_results: int = 10,
+        max_results: int = DEFAULT_MAX_PLACES,
     ) -> List[str]:
         loc_name = (location.name or "").lower()
 
         # ----- 1) Try curated city match -----
-        for city_key, places in FAMOUS_PLACES.items():
-            if city_key in loc_name:
-                logger.info(f"Using curated places for city match: {city_key!r}")
-                return places[:max_results]
+        cache_key = (loc_name, max_results)
+        places = _CURATED_CACHE.get(cache_key)
+        if places is MISSING:
+            places = self._get_curated_places(loc_name, max_results)
+            _CURATED_CACHE.set(cache_key, places)
+
+        # ----- 2) Fallback to Overpass (tourist-ish tags only) -----
+        if places is None:
+            logger.info(
+                "No curated places for %r, falling back to Overpass.", location.name
+            )
+            places = await self._get_overpass_places(
+                location.latitude, location.longitude, radius_m, max_results
+            )
+
+            if places is None:
+                return []
+
+        return places
+
+    def _get_curated_places(
+        self, loc_name: str, max_results: int
+    ) -> Optional[List[str]]:
+        m = _CITY_RE.search(loc_name)
+        if m:
+            city_key = _CITY_KEYS[m.group(0)]
+            logger.info("Using curated places for city match: %r", city_key)
+            return FAMOUS_PLACES[city_key][:max_results]
 
         # Also try looser word match (e.g., "South Mumbai", "Goa District")
-        for city_key, places in FAMOUS_PLACES.items():
-            if any(word in loc_name for word in city_key.split()):
-                logger.info(
-                    f"Using curated places for loose city match: {city_key!r}"
-                )
-                return places[:max_results]
+        m = _CITY_WORD_RE.search(loc_name)
+        if m:
+            city_key = _CITY_WORD_KEYS[m.group(0)]
+            logger.info("Using curated places for loose city match: %r", city_key)
+            return FAMOUS_PLACES[city_key][:max_results]
 
-        logger.info(
-            f"No curated places for '{location.name}', falling back to Overpass."
-        )
+        return None
 
-        # ----- 2) Fallback to Overpass (tourist-ish tags only) -----
-        lat = location.latitude
-        lon = location.longitude
+    async def _get_overpass_places(
+        self,
+        lat: float,
+        lon: float,
+        radius_m: int,
+        max_results: int,
+    ) -> Optional[List[str]]:
+        """
+        Query Overpass for named tourist POIs. Returns None if the request
+        fails, so callers can tell "no results" apart from an error.
+        """
+        cache_key = (round(lat, 3), round(lon, 3), radius_m, max_results)
+        cached = _OVERPASS_CACHE.get(cache_key)
+        if cached is not MISSING:
+            logger.info("Overpass cache hit near (%s, %s)", lat, lon)
+            return cached
 
+        # Only names are read, so ask for tags without geometry ("out tags"):
+        # the cap already bounds the payload to max_results * 3 elements.
         overpass_query = f"""
 [out:json][timeout:25];
 (
@@ -145,56 +244,46 @@ class PlacesAgent:
   node["leisure"~"park|garden"]["name"](around:{radius_m},{lat},{lon});
   way["leisure"~"park|garden"]["name"](around:{radius_m},{lat},{lon});
 );
-out center {max_results * 3};
+out tags {max_results * 3};
 """
 
         try:
-            async with httpx.AsyncClient(timeout=25.0) as client:
-                resp = await client.post(
-                    OVERPASS_URL,
-                    data={"data": overpass_query},
-                    headers={"User-Agent": "inkle-tourism-assignment/0.1"},
-                )
-                resp.raise_for_status()
+            client = get_http_client()
+            resp = await client.post(
+                OVERPASS_URL,
+                data={"data": overpass_query},
+                headers={"User-Agent": "inkle-tourism-assignment/0.1"},
+                timeout=25.0,
+            )
+            resp.raise_for_status()
         except httpx.HTTPError as exc:
-            logger.error(f"Overpass request failed: {exc}")
-            return []
+            logger.error("Overpass request failed: %s", exc)
+            return None
+
+        data = orjson.loads(resp.content)
+
+        # On timeout / out-of-memory Overpass still answers 200, with a
+        # "remark" and empty or partial elements. Treat it as a failure so
+        # an incomplete result isn't cached.
+        if data.get("remark"):
+            logger.error("Overpass query failed: %s", data["remark"])
+            return None
 
-        data = resp.json()
         elements = data.get("elements", [])
         logger.info(
-            f"Overpass returned {len(elements)} raw elements near ({lat}, {lon})."
+            "Overpass returned %d raw elements near (%s, %s).", len(elements), lat, lon
         )
 
         names: List[str] = []
         seen = set()
 
-        banned_substrings = [
-            "hotel",
-            "hostel",
-            "guest house",
-            "guesthouse",
-            "lodge",
-            "pg",
-            "boys hostel",
-            "girls hostel",
-            "residency",
-            "residence",
-            "enterprise",
-            "enterprises",
-            "hall",
-            "mahal",
-            "marriage",
-        ]
-
         for el in elements:
             tags = el.get("tags", {})
             name = tags.get("name")
             if not name:
                 continue
 
-            lower = name.lower()
-            if any(bad in lower for bad in banned_substrings):
+            if _BANNED_NAME_RE.search(name):
                 continue
 
             if name in seen:
@@ -207,5 +296,6 @@ out center {max_results * 3};
         if len(names) > max_results:
             names = names[:max_results]
 
-        logger.info(f"Final tourist places near ({lat}, {lon}): {names}")
+        logger.info("Final tourist places near (%s, %s): %s", lat, lon, names)
+        _OVERPASS_CACHE.set(cache_key, names)
         return names
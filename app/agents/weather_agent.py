@@ -17,7 +17,9 @@ class WeatherAgent:
         weather = await get_current_weather(location.latitude, location.longitude)
         if weather is None:
             logger.warning(
-                f"WeatherAgent: no weather data for {location.name} "
-                f"({location.latitude}, {location.longitude})"
+                "WeatherAgent: no weather data for %s (%s, %s)",
+                location.name,
+                location.latitude,
+                location.longitude,
             )
         return weather
@@ -38,7 +38,9 @@ async def chat_endpoint(payload: ChatRequest):
     """
     result: TourismAgentResult = await parent_agent.handle_message(payload.message)
 
-    return ChatResponse(
+    # Fields come from an already-validated TourismAgentResult, so skip
+    # re-validating them here.
+    return ChatResponse.model_construct(
         reply=result.reply,
         place=result.place,
         weather=result.weather,
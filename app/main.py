@@ -1,13 +1,27 @@
 # app/main.py
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.chat import router as chat_router
+from app.services.http_client import close_http_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Close pooled outbound connections on shutdown
+    await close_http_client()
+
 
 app = FastAPI(
     title="Inkle Tourism Agent Backend",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Allow frontend to call backend
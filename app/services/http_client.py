@@ -0,0 +1,43 @@
+# app/services/http_client.py
+
+from typing import Optional
+
+import httpx
+
+# One pooled client for all outbound calls (Nominatim, Open-Meteo, Overpass,
+# local LLM) so warm requests reuse TCP/TLS connections. Per-service timeouts
+# and headers are passed on each request.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared AsyncClient, creating it on first use.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=10.0,
+            # Concurrent requests to the same host (e.g. batched Overpass
+            # calls) are multiplexed over one TLS connection where the server
+            # supports HTTP/2; others fall back to HTTP/1.1.
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                # Keep idle sockets (and their TLS sessions) around between
+                # bursts instead of httpx's 5s default.
+                keepalive_expiry=300,
+            ),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared AsyncClient (called on app shutdown).
+    """
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -3,12 +3,23 @@
 from typing import Optional
 
 import httpx
+import orjson
 
 from app.models.schemas import PlaceLocation
+from app.core.cache import MISSING, SingleFlight, TTLCache
 from app.core.logging_config import logger
+from app.services.http_client import get_http_client
 
 NOMINATIM_BASE_URL = "https://nominatim.openstreetmap.org/search"
 
+# Cities don't move: keep successful lookups for a day. Unknown places are
+# cached for a shorter time so typos don't re-hit Nominatim on every retry.
+GEOCODE_CACHE_TTL_S = 24 * 3600
+GEOCODE_NEGATIVE_CACHE_TTL_S = 10 * 60
+
+_GEOCODE_CACHE = TTLCache(maxsize=1024, ttl=GEOCODE_CACHE_TTL_S)
+_GEOCODE_INFLIGHT = SingleFlight()
+
 
 async def geocode_place(query: str) -> Optional[PlaceLocation]:
     """
@@ -22,6 +33,19 @@ async def geocode_place(query: str) -> Optional[PlaceLocation]:
         logger.warning("geocode_place called with empty query")
         return None
 
+    cache_key = query.lower()
+    cached = _GEOCODE_CACHE.get(cache_key)
+    if cached is not MISSING:
+        logger.info("Nominatim cache hit for query=%r", query)
+        return cached
+
+    # Concurrent misses for the same place share one Nominatim request
+    return await _GEOCODE_INFLIGHT.do(
+        cache_key, lambda: _fetch_place(query, cache_key)
+    )
+
+
+async def _fetch_place(query: str, cache_key: str) -> Optional[PlaceLocation]:
     params = {
         "q": query,
         "format": "json",
@@ -39,19 +63,20 @@ async def geocode_place(query: str) -> Optional[PlaceLocation]:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                NOMINATIM_BASE_URL, params=params, headers=headers
-            )
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.get(
+            NOMINATIM_BASE_URL, params=params, headers=headers, timeout=10.0
+        )
+        response.raise_for_status()
     except httpx.HTTPError as exc:
-        logger.error(f"Nominatim request failed: {exc}")
+        logger.error("Nominatim request failed: %s", exc)
         return None
 
-    data = response.json()
+    data = orjson.loads(response.content)
 
     if not isinstance(data, list) or len(data) == 0:
-        logger.info(f"Nominatim found no results for query={query!r}")
+        logger.info("Nominatim found no results for query=%r", query)
+        _GEOCODE_CACHE.set(cache_key, None, ttl=GEOCODE_NEGATIVE_CACHE_TTL_S)
         return None
 
     first = data[0]
@@ -62,7 +87,7 @@ async def geocode_place(query: str) -> Optional[PlaceLocation]:
         display_name = first.get("display_name") or query
         address = first.get("address") or {}
     except (TypeError, ValueError) as exc:
-        logger.error(f"Error parsing Nominatim response for {query!r}: {exc}")
+        logger.error("Error parsing Nominatim response for %r: %s", query, exc)
         return None
 
     # Prefer a short city-style name (city/town/village/state) over full display_name
@@ -82,9 +107,13 @@ async def geocode_place(query: str) -> Optional[PlaceLocation]:
     )
 
     logger.info(
-        f"Nominatim geocoded {query!r} -> "
-        f"{location.latitude}, {location.longitude} "
-        f"(raw={display_name}, chosen_name={location.name})"
+        "Nominatim geocoded %r -> %s, %s (raw=%s, chosen_name=%s)",
+        query,
+        location.latitude,
+        location.longitude,
+        display_name,
+        location.name,
     )
 
+    _GEOCODE_CACHE.set(cache_key, location)
     return location
@@ -3,12 +3,21 @@
 from typing import Optional
 
 import httpx
+import orjson
 
 from app.models.schemas import WeatherInfo
+from app.core.cache import MISSING, SingleFlight, TTLCache
 from app.core.logging_config import logger
+from app.services.http_client import get_http_client
 
 OPEN_METEO_BASE_URL = "https://api.open-meteo.com/v1/forecast"
 
+# Current weather doesn't change per second; ~1 km grid cells share an entry.
+WEATHER_CACHE_TTL_S = 10 * 60
+
+_WEATHER_CACHE = TTLCache(maxsize=1024, ttl=WEATHER_CACHE_TTL_S)
+_WEATHER_INFLIGHT = SingleFlight()
+
 
 async def get_current_weather(latitude: float, longitude: float) -> Optional[WeatherInfo]:
     """
@@ -17,6 +26,21 @@ async def get_current_weather(latitude: float, longitude: float) -> Optional[Wea
     Returns:
         WeatherInfo if successful, otherwise None.
     """
+    cache_key = (round(latitude, 2), round(longitude, 2))
+    cached = _WEATHER_CACHE.get(cache_key)
+    if cached is not MISSING:
+        logger.info("Open-Meteo cache hit for %s", cache_key)
+        return cached
+
+    # Concurrent misses for the same grid cell share one Open-Meteo request
+    return await _WEATHER_INFLIGHT.do(
+        cache_key, lambda: _fetch_weather(latitude, longitude, cache_key)
+    )
+
+
+async def _fetch_weather(
+    latitude: float, longitude: float, cache_key: tuple
+) -> Optional[WeatherInfo]:
     params = {
         "latitude": latitude,
         "longitude": longitude,
@@ -25,14 +49,14 @@ async def get_current_weather(latitude: float, longitude: float) -> Optional[Wea
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(OPEN_METEO_BASE_URL, params=params)
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.get(OPEN_METEO_BASE_URL, params=params, timeout=10.0)
+        response.raise_for_status()
     except httpx.HTTPError as exc:
-        logger.error(f"Open-Meteo request failed: {exc}")
+        logger.error("Open-Meteo request failed: %s", exc)
         return None
 
-    data = response.json()
+    data = orjson.loads(response.content)
 
     current = data.get("current")
     if not isinstance(current, dict):
@@ -40,28 +64,32 @@ async def get_current_weather(latitude: float, longitude: float) -> Optional[Wea
         return None
 
     try:
-        temperature_c = float(current.get("temperature_2m"))
-        precipitation = current.get("precipitation")
-        is_raining: Optional[bool] = None
-
-        if precipitation is not None:
-            # If precipitation > 0, we can say it's raining
-            try:
-                is_raining = float(precipitation) > 0.0
-            except (TypeError, ValueError):
-                is_raining = None
+        # Replies only show whole degrees, so round once here
+        temperature_c = round(float(current.get("temperature_2m")), 0)
     except (TypeError, ValueError) as exc:
-        logger.error(f"Error parsing Open-Meteo response: {exc}")
+        logger.error("Error parsing Open-Meteo response: %s", exc)
         return None
 
-    weather = WeatherInfo(
+    # If precipitation > 0, we can say it's raining. The JSON decoder already
+    # gives us a number, so no float() round-trip is needed.
+    precipitation = current.get("precipitation")
+    is_raining: Optional[bool] = None
+    if isinstance(precipitation, (int, float)):
+        is_raining = precipitation > 0
+
+    # Both fields are already normalized above; skip pydantic validation
+    weather = WeatherInfo.model_construct(
         temperature_c=temperature_c,
         is_raining=is_raining,
     )
 
     logger.info(
-        f"Open-Meteo weather @ ({latitude}, {longitude}) -> "
-        f"{weather.temperature_c}°C, is_raining={weather.is_raining}"
+        "Open-Meteo weather @ (%s, %s) -> %s°C, is_raining=%s",
+        latitude,
+        longitude,
+        weather.temperature_c,
+        weather.is_raining,
     )
 
+    _WEATHER_CACHE.set(cache_key, weather)
     return weather
@@ -1,67 +1,357 @@
 # app/services/overpass_client.py
 
+import asyncio
+import itertools
+import random
+import time
 import httpx
-from typing import List, Optional
+import orjson
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import quote_from_bytes
 
+from app.core.cache import MISSING, SingleFlight, TTLCache
 from app.core.logging_config import logger
+from app.services.http_client import get_http_client
 
 
-OVERPASS_URL = "https://overpass-api.de/api/interpreter"
+# Public Overpass instances, used round-robin to spread load
+OVERPASS_URLS: Tuple[str, ...] = (
+    "https://overpass-api.de/api/interpreter",
+    "https://overpass.kumi.systems/api/interpreter",
+    "https://overpass.openstreetmap.ru/api/interpreter",
+)
+
+# Rate-limited / overloaded responses worth retrying on another mirror
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+MAX_ATTEMPTS = 3
+
+# Responses are read incrementally and abandoned past this size, so a
+# misbehaving mirror can't make us buffer an unbounded body.
+MAX_RESPONSE_BYTES = 1024 * 1024
+
+# Overpass rejects clients with more parallel requests than this per
+# instance (429), so excess callers queue locally instead.
+MAX_CONCURRENT_PER_MIRROR = 2
+
+# A mirror with this many failures in the last window is skipped
+MIRROR_MAX_FAILURES = 3
+MIRROR_FAILURE_WINDOW_S = 60.0
+
+OVERPASS_HEADERS = {
+    "User-Agent": "inkle-tourism-agent/0.1",
+    # Overpass JSON compresses very well; httpx decodes it transparently
+    "Accept-Encoding": "gzip, deflate",
+    # Bodies are pre-encoded as "data=<query>" (see _encode_form_body)
+    "Content-Type": "application/x-www-form-urlencoded",
+}
+
+# A 2 km search radius is insensitive to input jitter, so results are cached
+# per ~110 m grid cell (coordinates rounded to 3 decimals).
+PLACES_CACHE_TTL_S = 3600
+# Places with no attractions at all (sea, desert) stay that way, so empty
+# results are kept longer.
+PLACES_NEGATIVE_CACHE_TTL_S = 24 * 3600
+
+_PLACES_CACHE = TTLCache(maxsize=4096, ttl=PLACES_CACHE_TTL_S)
+_PLACES_INFLIGHT = SingleFlight()
+
+# get_places() calls arriving within this window are merged into one
+# Overpass query (flushed early once the batch is full).
+BATCH_MAX_SIZE = 16
+BATCH_MAX_WAIT_S = 0.025
+
+# A derived element ("make") is emitted before each coordinate's results,
+# so the combined response can be split back per coordinate.
+_BATCH_MARKER_TYPE = "inkle_batch"
+
+# Overpass QL, prepared once at import: each coordinate only fills in its
+# index and lat/lon. Only named elements are useful and only their tags are
+# read, so filter on ["name"] and skip geometry server-side. Names repeat
+# across elements (a park as both node and way), so over-fetch and let
+# get_places_many() stop at 5 unique ones.
+OVERPASS_OUT_LIMIT = 15
+_QUERY_HEADER = "[out:json][timeout:25];"
+_QUERY_BLOCK_TMPL = (
+    "("
+    'nwr["tourism"]["name"](around:2000,{lat},{lon});'
+    'nwr["leisure"="park"]["name"](around:2000,{lat},{lon});'
+    ")->.s{idx};"
+    f'make {_BATCH_MARKER_TYPE} idx="{{idx}}";'
+    "out;"
+    f".s{{idx}} out tags {OVERPASS_OUT_LIMIT};"
+).format
+
+_mirror_cycle = itertools.cycle(OVERPASS_URLS)
+_mirror_failures: Dict[str, List[float]] = {url: [] for url in OVERPASS_URLS}
+_mirror_semaphores: Dict[str, asyncio.Semaphore] = {
+    url: asyncio.Semaphore(MAX_CONCURRENT_PER_MIRROR) for url in OVERPASS_URLS
+}
+
+
+def _recent_failures(url: str) -> int:
+    cutoff = time.monotonic() - MIRROR_FAILURE_WINDOW_S
+    failures = [t for t in _mirror_failures[url] if t > cutoff]
+    _mirror_failures[url] = failures
+    return len(failures)
+
+
+def _next_mirror() -> str:
+    for _ in range(len(OVERPASS_URLS)):
+        url = next(_mirror_cycle)
+        if _recent_failures(url) < MIRROR_MAX_FAILURES:
+            return url
+
+    # Every mirror is unhealthy: keep rotating rather than failing outright
+    return next(_mirror_cycle)
+
+
+async def _read_body(response: httpx.Response) -> bytes:
+    chunks: List[bytes] = []
+    size = 0
+
+    async for chunk in response.aiter_bytes():
+        size += len(chunk)
+        if size > MAX_RESPONSE_BYTES:
+            raise httpx.HTTPError(
+                f"Overpass response exceeded {MAX_RESPONSE_BYTES} bytes"
+            )
+        chunks.append(chunk)
+
+    return b"".join(chunks)
+
+
+def _encode_form_body(query: str) -> bytes:
+    # Equivalent to httpx's data={"data": query}, done once per query
+    # rather than by httpx on every attempt.
+    return b"data=" + quote_from_bytes(query.encode("utf-8"), safe=b"").encode("ascii")
+
+
+async def _post_overpass(query: str) -> bytes:
+    """
+    POST a query to the next healthy mirror and return the response body,
+    retrying transport errors and 429/5xx responses on other mirrors with
+    exponential backoff.
+    Raises the last httpx error if every attempt fails.
+    """
+    client = get_http_client()
+    content = _encode_form_body(query)
+
+    for attempt in range(MAX_ATTEMPTS):
+        url = _next_mirror()
+        try:
+            # The slot is released before any backoff sleep below
+            async with _mirror_semaphores[url]:
+                async with client.stream(
+                    "POST",
+                    url,
+                    content=content,
+                    headers=OVERPASS_HEADERS,
+                    timeout=15.0,
+                ) as response:
+                    response.raise_for_status()
+                    return await _read_body(response)
+        except (httpx.HTTPStatusError, httpx.TransportError) as exc:
+            if (
+                isinstance(exc, httpx.HTTPStatusError)
+                and exc.response.status_code not in RETRY_STATUS_CODES
+            ):
+                raise
+
+            _mirror_failures[url].append(time.monotonic())
+            if attempt == MAX_ATTEMPTS - 1:
+                raise
+
+            delay = min(30.0, 0.5 * 2**attempt) + random.random() * 0.25
+            logger.debug(
+                "Overpass mirror %s failed (%s), retrying in %.2fs", url, exc, delay
+            )
+            await asyncio.sleep(delay)
+
+    raise RuntimeError("unreachable")
+
+
+def _build_batch_query(coords: List[Tuple[float, float]]) -> str:
+    return _QUERY_HEADER + "".join(
+        _QUERY_BLOCK_TMPL(idx=idx, lat=latitude, lon=longitude)
+        for idx, (latitude, longitude) in enumerate(coords)
+    )
 
 
 async def get_places(latitude: float, longitude: float) -> Optional[List[str]]:
     """
     Fetch up to 5 tourist attractions or parks near the given location using Overpass API.
     Returns: list of place names or None on failure.
+
+    Results are cached per ~110 m grid cell; concurrent misses for the same
+    cell share one lookup, and lookups for different cells are batched into
+    a single Overpass request.
     """
-    # Overpass QL query
-    query = f"""
-    [out:json][timeout:25];
-    (
-      node["tourism"](around:2000,{latitude},{longitude});
-      way["tourism"](around:2000,{latitude},{longitude});
-      relation["tourism"](around:2000,{latitude},{longitude});
-
-      node["leisure"="park"](around:2000,{latitude},{longitude});
-      way["leisure"="park"](around:2000,{latitude},{longitude});
-      relation["leisure"="park"](around:2000,{latitude},{longitude});
-    );
-    out center 20;
+    cache_key = (round(latitude, 3), round(longitude, 3))
+    cached = _PLACES_CACHE.get(cache_key)
+    if cached is not MISSING:
+        if cached:
+            logger.info("Overpass cache hit for %s", cache_key)
+        else:
+            logger.debug("Overpass negative cache hit (no attractions) for %s", cache_key)
+        return cached
+
+    return await _PLACES_INFLIGHT.do(
+        cache_key, lambda: _fetch_places(latitude, longitude, cache_key)
+    )
+
+
+async def _fetch_places(
+    latitude: float, longitude: float, cache_key: Tuple[float, float]
+) -> Optional[List[str]]:
+    place_names = await _BATCHER.submit(latitude, longitude)
+
+    # Don't cache failures
+    if place_names:
+        _PLACES_CACHE.set(cache_key, place_names)
+    elif place_names is not None:
+        _PLACES_CACHE.set(cache_key, place_names, ttl=PLACES_NEGATIVE_CACHE_TTL_S)
+
+    return place_names
+
+
+async def get_places_many(
+    coords: List[Tuple[float, float]],
+) -> Optional[List[List[str]]]:
     """
+    Fetch up to 5 tourist attractions or parks near each (lat, lon) with a
+    single Overpass request.
+    Returns: one list of place names per coordinate (same order), or None on failure.
+    """
+    if not coords:
+        return []
+
+    query = _build_batch_query(coords)
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.post(
-                OVERPASS_URL,
-                data={"data": query},
-                headers={"User-Agent": "inkle-tourism-agent/0.1"},
-            )
-            response.raise_for_status()
+        body = await _post_overpass(query)
     except httpx.HTTPError as exc:
-        logger.error(f"Overpass request failed: {exc}")
+        logger.error("Overpass request failed: %s", exc)
+        return None
+
+    # Overloaded mirrors sometimes answer with an HTML error page or a
+    # truncated body; treat that like any other failed request.
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError as exc:
+        logger.error("Overpass returned invalid JSON: %s", exc)
+        return None
+    if not isinstance(data, dict):
+        logger.error("Overpass returned unexpected JSON: %s", type(data).__name__)
+        return None
+
+    # A query that hits Overpass's timeout or memory limit still gets a 200,
+    # with a "remark" and empty or partial elements. That must not be
+    # mistaken for "no attractions here" and negative-cached.
+    if data.get("remark"):
+        logger.error("Overpass query failed: %s", data["remark"])
         return None
 
-    data = response.json()
     elements = data.get("elements", [])
 
-    if not elements:
-        logger.info("Overpass: no attractions found for this location")
-        return []
+    # Insertion-ordered dicts double as "seen" sets, so names are
+    # deduplicated while collecting the first 5 unique per coordinate.
+    buckets: List[Dict[str, None]] = [{} for _ in coords]
+    bucket: Optional[Dict[str, None]] = None
 
-    place_names = []
     for el in elements:
-        tags = el.get("tags", {})
-        name = tags.get("name")
+        # The query filters on ["name"] and markers always carry "idx", so
+        # every element has tags; a missing key is the rare case.
+        try:
+            tags = el["tags"]
+            if el["type"] == _BATCH_MARKER_TYPE:
+                bucket = buckets[int(tags["idx"])]
+                continue
+            name = tags["name"]
+        except KeyError:
+            continue
 
-        if name:
-            place_names.append(name)
+        if bucket is None or len(bucket) >= 5:
+            continue
 
-        if len(place_names) >= 5:
-            break
+        # Empty names are still possible in OSM data
+        if name and name not in bucket:
+            bucket[name] = None
 
-    # Deduplicate
-    place_names = list(dict.fromkeys(place_names))
+    results: List[List[str]] = []
+    for (latitude, longitude), seen in zip(coords, buckets):
+        if not seen:
+            logger.info("Overpass: no attractions found for this location")
 
-    logger.info(f"Overpass found {len(place_names)} places near ({latitude}, {longitude})")
+        place_names = list(seen)
 
-    return place_names
+        logger.info(
+            "Overpass found %d places near (%s, %s)",
+            len(place_names),
+            latitude,
+            longitude,
+        )
+        results.append(place_names)
+
+    return results
+
+
+class _PlacesBatcher:
+    """
+    Collects get_places() calls and resolves them with one get_places_many()
+    request per batch.
+    """
+
+    def __init__(self, max_size: int, max_wait_s: float) -> None:
+        self.max_size = max_size
+        self.max_wait_s = max_wait_s
+        self._pending: List[
+            Tuple[float, float, "asyncio.Future[Optional[List[str]]]"]
+        ] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def submit(self, latitude: float, longitude: float) -> Optional[List[str]]:
+        loop = asyncio.get_running_loop()
+        fut: "asyncio.Future[Optional[List[str]]]" = loop.create_future()
+        self._pending.append((latitude, longitude, fut))
+
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait_s, self._flush)
+
+        return await fut
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        # Keep a reference so the task isn't garbage-collected mid-flight
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self,
+        batch: List[Tuple[float, float, "asyncio.Future[Optional[List[str]]]"]],
+    ) -> None:
+        try:
+            results = await get_places_many([(lat, lon) for lat, lon, _ in batch])
+        except Exception as exc:
+            for _, _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+
+        for idx, (_, _, fut) in enumerate(batch):
+            # A caller may have been cancelled while waiting
+            if not fut.done():
+                fut.set_result(None if results is None else results[idx])
+
+
+_BATCHER = _PlacesBatcher(max_size=BATCH_MAX_SIZE, max_wait_s=BATCH_MAX_WAIT_S)